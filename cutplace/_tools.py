@@ -20,10 +20,11 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import collections
 import errno
 import logging
 import os
-import io
+import re
 import token
 import tokenize
 
@@ -41,6 +42,34 @@ LOG_LEVEL_NAME_TO_LEVEL_MAP = {
     "critical": logging.CRITICAL
 }
 
+#: Regular expression matching a Python name, which similar to
+#: :py:mod:`tokenize` under Python 3 can also contain non ASCII letters.
+_PYTHON_NAME_REGEX = re.compile(r'[^\W\d]\w*', re.UNICODE)
+
+#: Regular expression to split text into the kind of tokens cutplace rules
+#: are composed of. Numbers and single line strings use the same patterns as
+#: :py:mod:`tokenize`; any other non white space character ends up as
+#: single character operator.
+_TOKEN_REGEX = re.compile(
+    r'\s+'
+    r'|(?P<STRING>\'\'\'(?:[^\'\\]|\\.|\'(?!\'\'))*\'\'\'|"""(?:[^"\\]|\\.|"(?!""))*"""|' + tokenize.String + r')'
+    r'|(?P<NUMBER>' + tokenize.Number + r')'
+    r'|(?P<NAME>\w+)'
+    r'|(?P<OP>' + tokenize.Funny + r'|\S)', re.UNICODE)
+
+_TOKEN_GROUP_NAME_TO_TYPE_MAP = {
+    'NAME': token.NAME,
+    'NUMBER': token.NUMBER,
+    'OP': token.OP,
+    'STRING': token.STRING,
+}
+
+#: Token as yielded by :py:func:`tokenize_without_space` with ``type`` being
+#: a constant from :py:mod:`token`.
+Token = collections.namedtuple('Token', ['type', 'text'])
+
+_END_TOKEN = Token(token.ENDMARKER, '')
+
 
 def mkdirs(folder):
     """
@@ -69,21 +98,17 @@ def validated_python_name(name, value):
     assert name
     assert value is not None
 
-    readable = io.StringIO(value.strip())
-    toky = tokenize.generate_tokens(readable.readline)
-    next_token = next(toky)
-    next_type = next_token[0]
-    result = next_token[1]
-    if tokenize.ISEOF(next_type):
+    result = value.strip()
+    if not result:
         raise NameError("%s must not be empty but was: %r" % (name, value))
-    if next_type != token.NAME:
+    name_match = _PYTHON_NAME_REGEX.match(result)
+    if name_match is None:
         raise NameError("%s must contain only ASCII letters, digits and underscore (_) but is: %r"
                         % (name, value))
-    second_token = next(toky)
-    second_token_type = second_token[0]
-    # on unix, tokenize return a return char before the EOF
-    if not tokenize.ISEOF(second_token_type) and not second_token_type == 4:
-        raise NameError("%s must be a single word, but after %r there also is %r" % (name, result, second_token[1]))
+    name_end = name_match.end()
+    if name_end != len(result):
+        raise NameError("%s must be a single word, but after %r there also is %r"
+                        % (name, result[:name_end], result[name_end:].strip()))
     return result
 
 
@@ -101,13 +126,8 @@ def human_readable_list(items, final_separator='or'):
     elif item_count == 1:
         result = _compat.text_repr(items[0])
     else:
-        result = ''
-        for item_index in range(item_count):
-            if item_index == item_count - 1:
-                result += ' ' + final_separator + ' '
-            elif item_index > 0:
-                result += ', '
-            result += _compat.text_repr(items[item_index])
+        item_texts = [_compat.text_repr(item) for item in items]
+        result = ', '.join(item_texts[:-1]) + ' ' + final_separator + ' ' + item_texts[-1]
         assert result
     assert result is not None
     return result
@@ -115,14 +135,15 @@ def human_readable_list(items, final_separator='or'):
 
 def tokenize_without_space(text):
     """
-    ``text`` split into token with any white space tokens removed.
+    ``text`` split into :py:class:`Token` with any white space tokens
+    removed. The last token always is a :py:const:`token.ENDMARKER`.
     """
     assert text is not None
-    for toky in tokenize.generate_tokens(_compat.token_io_readline(text)):
-        toky_type = toky[0]
-        toky_text = toky[1]
-        if ((toky_type != token.INDENT) and toky_text.strip()) or (toky_type == token.ENDMARKER):
-            yield toky
+    for token_match in _TOKEN_REGEX.finditer(text):
+        group_name = token_match.lastgroup
+        if group_name is not None:
+            yield Token(_TOKEN_GROUP_NAME_TO_TYPE_MAP[group_name], token_match.group())
+    yield _END_TOKEN
 
 
 def token_text(toky):
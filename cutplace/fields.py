@@ -46,6 +46,13 @@ _FieldFormatClassSuffix = "FieldFormat"
 _ASCII_LETTERS = set(string.ascii_letters)
 _ASCII_LETTERS_DIGITS_AND_UNDERSCORE = set(string.ascii_letters + string.digits + '_')
 
+# Rules for choices consisting only of names separated by commas, which can be split without tokenizing.
+_SIMPLE_CHOICE_RULE_REGEX = re.compile(r'^\s*[^\W\d]\w*(?:\s*,\s*[^\W\d]\w*)*\s*$', re.UNICODE)
+
+# Cache for :py:func:`_choices_from_rule`, which is cleared once it holds too many rules.
+_RULE_TO_CHOICES_MAP = {}
+_MAX_CACHED_CHOICE_RULE_COUNT = 1024
+
 
 @python_2_unicode_compatible
 class AbstractFieldFormat(object):
@@ -268,15 +275,20 @@ class AbstractFieldFormat(object):
             _compat.text_repr(self.length), _compat.text_repr(self.rule))
 
 
-class ChoiceFieldFormat(AbstractFieldFormat):
+def _choices_from_rule(rule):
     """
-    Field format accepting only values from a pool of choices.
+    Tuple of choices described by ``rule`` for a
+    :py:class:`ChoiceFieldFormat`. Because the same rules often are used by
+    several fields, the result is cached.
     """
-    def __init__(self, field_name, is_allowed_to_be_empty, length, rule, data_format):
-        super(ChoiceFieldFormat, self).__init__(
-            field_name, is_allowed_to_be_empty, length, rule, data_format, empty_value='')
-        self.choices = []
-
+    assert rule is not None
+
+    result = _RULE_TO_CHOICES_MAP.get(rule)
+    if result is None and _SIMPLE_CHOICE_RULE_REGEX.match(rule):
+        # Fast lane for rules like "red, green, blue".
+        result = tuple(choice.strip() for choice in rule.split(','))
+    if result is None:
+        choices = []
         # Split rule into tokens, ignoring white space.
         tokens = _tools.tokenize_without_space(rule)
 
@@ -296,7 +308,7 @@ class ChoiceFieldFormat(AbstractFieldFormat):
             if not choice:
                 raise errors.InterfaceError(
                     "choice field must be allowed to be empty instead of containing an empty choice")
-            self.choices.append(choice)
+            choices.append(choice)
             toky = next(tokens)
             if not _tools.is_eof_token(toky):
                 if not _tools.is_comma_token(toky):
@@ -307,6 +319,21 @@ class ChoiceFieldFormat(AbstractFieldFormat):
                 toky = next(tokens)
                 if _tools.is_eof_token(toky):
                     raise errors.InterfaceError("trailing comma (,) must be removed")
+        result = tuple(choices)
+        if len(_RULE_TO_CHOICES_MAP) >= _MAX_CACHED_CHOICE_RULE_COUNT:
+            _RULE_TO_CHOICES_MAP.clear()
+        _RULE_TO_CHOICES_MAP[rule] = result
+    return result
+
+
+class ChoiceFieldFormat(AbstractFieldFormat):
+    """
+    Field format accepting only values from a pool of choices.
+    """
+    def __init__(self, field_name, is_allowed_to_be_empty, length, rule, data_format):
+        super(ChoiceFieldFormat, self).__init__(
+            field_name, is_allowed_to_be_empty, length, rule, data_format, empty_value='')
+        self.choices = list(_choices_from_rule(rule))
         if not self.is_allowed_to_be_empty and not self.choices:
             raise errors.InterfaceError("choice field without any choices must be allowed to be empty")
 
@@ -40,6 +40,15 @@ from cutplace._compat import python_2_unicode_compatible
 
 _log = logging.getLogger("cutplace")
 
+#: Cache for :py:meth:`Cid._create_name_to_class_map` using
+#: ``(base_class, number_of_subclasses)`` as key so that plugins imported
+#: later on result in a new map.
+_BASE_CLASS_AND_SUBCLASS_COUNT_TO_NAME_TO_CLASS_MAP = {}
+
+#: Cache for :py:meth:`Cid._create_type_to_class_map` using the same key as
+#: :py:data:`_BASE_CLASS_AND_SUBCLASS_COUNT_TO_NAME_TO_CLASS_MAP`.
+_BASE_CLASS_AND_SUBCLASS_COUNT_TO_TYPE_TO_CLASS_MAP = {}
+
 
 @python_2_unicode_compatible
 class Cid(object):
@@ -47,7 +56,26 @@ class Cid(object):
     _ID_CHECK = "c"
     _ID_DATA_FORMAT = "d"
     _ID_FIELD_RULE = "f"
-    _VALID_IDS = [_ID_CHECK, _ID_DATA_FORMAT, _ID_FIELD_RULE]
+    _VALID_IDS = frozenset([_ID_CHECK, _ID_DATA_FORMAT, _ID_FIELD_RULE])
+
+    __slots__ = (
+        '_check_name_to_check_map',
+        '_check_name_to_class_map',
+        '_check_names',
+        '_check_type_to_class_map',
+        '_cid_path',
+        '_data_format',
+        '_field_count',
+        '_field_format_name_to_class_map',
+        '_field_formats',
+        '_field_name_to_format_map',
+        '_field_name_to_index_map',
+        '_field_names',
+        '_field_type_to_class_cache',
+        '_location',
+        '_row_type_to_add_cid_row_map',
+        '_validate_field_length',
+    )
 
     def __init__(self, cid_path=None):
         """
@@ -63,7 +91,9 @@ class Cid(object):
         """
         self._cid_path = cid_path
         self._data_format = None
+        self._validate_field_length = None
         self._field_names = []
+        self._field_count = 0
         self._field_formats = []
         self._field_name_to_format_map = {}
         self._field_name_to_index_map = {}
@@ -72,7 +102,14 @@ class Cid(object):
         self._check_name_to_check_map = {}
         self._location = None
         self._check_name_to_class_map = Cid._create_name_to_class_map(checks.AbstractCheck)
+        self._check_type_to_class_map = Cid._create_type_to_class_map(checks.AbstractCheck, "Check")
         self._field_format_name_to_class_map = Cid._create_name_to_class_map(fields.AbstractFieldFormat)
+        self._field_type_to_class_cache = {}
+        self._row_type_to_add_cid_row_map = {
+            Cid._ID_CHECK: self._add_check_cid_row,
+            Cid._ID_DATA_FORMAT: self._add_data_format_cid_row,
+            Cid._ID_FIELD_RULE: self._add_field_format_cid_row,
+        }
         if cid_path is not None:
             self.read(cid_path, rowio.auto_rows(cid_path))
         else:
@@ -151,33 +188,66 @@ class Cid(object):
     @staticmethod
     def _create_name_to_class_map(base_class):
         assert base_class is not None
+        subclasses = base_class.__subclasses__()
+        cache_key = (base_class, len(subclasses))
+        result = _BASE_CLASS_AND_SUBCLASS_COUNT_TO_NAME_TO_CLASS_MAP.get(cache_key)
+        if result is None:
+            result = Cid._create_uncached_name_to_class_map(subclasses)
+            _BASE_CLASS_AND_SUBCLASS_COUNT_TO_NAME_TO_CLASS_MAP[cache_key] = result
+        return result
+
+    @staticmethod
+    def _create_uncached_name_to_class_map(subclasses):
+        assert subclasses is not None
         result = {}
         # Note: we use a ``set`` of sub classes to ignore duplicates.
-        for class_to_process in set(base_class.__subclasses__()):
-            qualified_class_name = class_to_process.__name__
-            plain_class_name = qualified_class_name.split('.')[-1]
+        for class_to_process in set(subclasses):
+            # Note: Unlike ``__qualname__``, ``__name__`` never includes a module or outer class.
+            plain_class_name = class_to_process.__name__
             clashing_class = result.get(plain_class_name)
             if clashing_class is not None:
-                clashing_class_info = Cid._class_info(clashing_class)
-                class_to_process_info = Cid._class_info(class_to_process)
-                if clashing_class_info == class_to_process_info:
+                # Classes from different modules always clash, so only inspect the source files
+                # if the modules match.
+                is_duplicate_class = (clashing_class.__module__ == class_to_process.__module__) \
+                    and (Cid._class_info(clashing_class) == Cid._class_info(class_to_process))
+                if is_duplicate_class:
                     # HACK: Ignore duplicate classes. Such classes can occur after `import_plugins`
                     # has been called more than once.
                     class_to_process = None
                 else:
                     raise errors.CutplaceError("clashing plugin class names must be resolved: %s and %s"
-                                               % (clashing_class_info, class_to_process_info))
+                                               % (Cid._class_info(clashing_class), Cid._class_info(class_to_process)))
             if class_to_process is not None:
                 result[plain_class_name] = class_to_process
         return result
 
+    @staticmethod
+    def _create_type_to_class_map(base_class, class_name_appendix):
+        """
+        Map of types as used in CIDs (for example ``'IsUnique'``) to the
+        subclasses of ``base_class`` (for example ``'IsUniqueCheck'``).
+        """
+        assert base_class is not None
+        assert class_name_appendix
+        cache_key = (base_class, len(base_class.__subclasses__()))
+        result = _BASE_CLASS_AND_SUBCLASS_COUNT_TO_TYPE_TO_CLASS_MAP.get(cache_key)
+        if result is None:
+            name_to_class_map = Cid._create_name_to_class_map(base_class)
+            appendix_length = len(class_name_appendix)
+            result = dict(
+                (class_name[:-appendix_length], class_to_map)
+                for class_name, class_to_map in name_to_class_map.items()
+                if class_name.endswith(class_name_appendix))
+            _BASE_CLASS_AND_SUBCLASS_COUNT_TO_TYPE_TO_CLASS_MAP[cache_key] = result
+        return result
+
     def _create_class(self, name_to_class_map, class_qualifier, class_name_appendix, type_name):
         assert name_to_class_map
         assert class_qualifier
         assert class_name_appendix
         assert type_name
 
-        class_name = class_qualifier.split(".")[-1] + class_name_appendix
+        class_name = class_qualifier.rpartition(".")[2] + class_name_appendix
         # class_qualifer need to have it first char in capital
         class_name = (class_name[:1].upper() + class_name[1:])
         result = name_to_class_map.get(class_name)
@@ -190,11 +260,11 @@ class Cid(object):
 
     def _create_field_format_class(self, field_type):
         assert field_type
-        return self._create_class(self._field_format_name_to_class_map, field_type, "FieldFormat", "field")
-
-    def _create_check_class(self, check_type):
-        assert check_type
-        return self._create_class(self._check_name_to_class_map, check_type, "Check", "check")
+        result = self._field_type_to_class_cache.get(field_type)
+        if result is None:
+            result = self._create_class(self._field_format_name_to_class_map, field_type, "FieldFormat", "field")
+            self._field_type_to_class_cache[field_type] = result
+        return result
 
     def add_data_format_row(self, row_data):
         """
@@ -225,11 +295,28 @@ class Cid(object):
                 'data format already is %s and must be set only once'
                 % _compat.text_repr(self._data_format.format),
                 self._location)
-        lower_value = value.lower()
         if self._data_format is None:
-            self._data_format = data.DataFormat(lower_value, self._location)
+            self._data_format = data.DataFormat(value.lower(), self._location)
+            # The data format is set only once, so decide now how to validate field lengths.
+            if self._data_format.format == data.FORMAT_FIXED:
+                self._validate_field_length = self._validate_fixed_field_length
+            else:
+                self._validate_field_length = self._validate_delimited_field_length
         else:
-            self._data_format.set_property(name.lower(), value, self._location)
+            self._data_format.set_property(lower_name, value, self._location)
+
+    def _add_data_format_cid_row(self, row):
+        # Only name and value are relevant, so avoid padding the whole row.
+        row_item_count = len(row)
+        name = row[1] if row_item_count > 1 else ''
+        value = row[2] if row_item_count > 2 else ''
+        self.add_data_format_row([name, value])
+
+    def _add_field_format_cid_row(self, row):
+        self.add_field_format_row(row[1:7])
+
+    def _add_check_cid_row(self, row):
+        self.add_check_row(row[1:7])
 
     def read(self, cid_path, rows):
         """
@@ -255,19 +342,18 @@ class Cid(object):
         if self._cid_path is None:
             self._cid_path = cid_path
         for row in rows:
-            if row:
+            # Skip empty rows and rows without type, for example comments, without any further processing.
+            if row and row[0]:
                 row_type = row[0].lower().strip()
-                row_data = (row[1:] + [''] * 6)[:6]
-                if row_type == 'd':
-                    self.add_data_format_row(row_data)
-                elif row_type == 'f':
-                    self.add_field_format_row(row_data)
-                elif row_type == 'c':
-                    self.add_check_row(row_data)
-                elif row_type != '':
+                add_cid_row = self._row_type_to_add_cid_row_map.get(row_type)
+                if add_cid_row is not None:
+                    add_cid_row(row)
+                elif row_type:
                     # Raise error when value is not supported.
                     raise errors.InterfaceError(
-                        'CID row type is "%s" but must be empty or one of: C, D, or F' % row_type, self._location)
+                        'CID row type is "%s" but must be empty or one of: %s'
+                        % (row_type, _tools.human_readable_list(
+                            [valid_id.upper() for valid_id in sorted(Cid._VALID_IDS)])), self._location)
             self._location.advance_line()
         if self.data_format is None:
             raise errors.InterfaceError('data format must be specified', self._location)
@@ -275,6 +361,33 @@ class Cid(object):
         if len(self.field_names) == 0:
             raise errors.InterfaceError('fields must be specified', self._location)
 
+    def _validate_fixed_field_length(self, field_name, field_length):
+        if field_length.items is None:
+            raise errors.InterfaceError(
+                "length of field %s must be specified with fixed data format" % _compat.text_repr(field_name),
+                self._location)
+        if field_length.lower_limit != field_length.upper_limit:
+            raise errors.InterfaceError(
+                "length of field %s for fixed data format must be a specific number but is: %s"
+                % (_compat.text_repr(field_name), field_length), self._location)
+        if field_length.lower_limit < 1:
+            raise errors.InterfaceError(
+                "length of field %s for fixed data format must be at least 1 but is: %d"
+                % (_compat.text_repr(field_name), field_length.lower_limit), self._location)
+
+    def _validate_delimited_field_length(self, field_name, field_length):
+        if field_length.lower_limit is not None:
+            if field_length.lower_limit < 0:
+                raise errors.InterfaceError(
+                    "lower limit for length of field %s must be at least 0 but is: %d"
+                    % (_compat.text_repr(field_name), field_length.lower_limit), self._location)
+        elif field_length.upper_limit is not None:
+            # Note: 0 as upper limit is valid for a field that must always be empty.
+            if field_length.upper_limit < 0:
+                raise errors.InterfaceError(
+                    "upper limit for length of field %s must be at least 0 but is: %d"
+                    % (_compat.text_repr(field_name), field_length.upper_limit), self._location)
+
     def add_field_format(self, field_format):
         """
         Add field to the Cid. Typically the field is created using the
@@ -297,6 +410,7 @@ class Cid(object):
         self._field_name_to_index_map[field_name] = len(self._field_names)
         self._field_names.append(field_name)
         self._field_formats.append(field_format)
+        self._field_count += 1
         # TODO: Remember location where field format was defined to later include it in error message
         _log.debug("%s: defined field: %s", self._location, field_format)
 
@@ -326,27 +440,28 @@ class Cid(object):
 
         # Assert that the various lists and maps related to fields are in a consistent state.
         # Ideally this would be a class invariant, but this is Python, not Eiffel.
-        field_count = len(self.field_names)
+        field_count = self._field_count
+        assert len(self._field_names) == field_count
         assert len(self._field_formats) == field_count
         assert len(self._field_name_to_format_map) == field_count
         assert len(self._field_name_to_index_map) == field_count
 
-        items = (possibly_incomplete_items + 6 * [''])[:6]
+        item_count = len(possibly_incomplete_items)
 
         # Obtain field name.
-        field_name = fields.validated_field_name(items[0], self._location)
+        field_name = fields.validated_field_name(
+            possibly_incomplete_items[0] if item_count > 0 else '', self._location)
         if field_name in self._field_name_to_format_map:
             # TODO: Add see_also_location pointing to previous declaration.
             raise errors.InterfaceError(
                 'duplicate field name must be changed to a unique one: %s' % field_name, self._location)
 
-        # Obtain example.
-        self._location.advance_cell()
-        field_example = items[1]
-
-        # Obtain "empty" mark.
-        self._location.advance_cell()
-        field_is_allowed_to_be_empty_text = items[2].strip().lower()
+        # Obtain example and "empty" mark. Only the latter can cause an error, so
+        # move the location to its cell right away.
+        self._location.advance_cell(2)
+        field_example = possibly_incomplete_items[1] if item_count > 1 else ''
+        field_is_allowed_to_be_empty_text = (
+            possibly_incomplete_items[2].strip().lower() if item_count > 2 else '')
         if field_is_allowed_to_be_empty_text == '':
             field_is_allowed_to_be_empty = False
         elif field_is_allowed_to_be_empty_text == self._EMPTY_INDICATOR:
@@ -356,34 +471,32 @@ class Cid(object):
                 "mark for empty field must be %s or empty but is %s"
                 % (self._EMPTY_INDICATOR, field_is_allowed_to_be_empty_text), self._location)
 
-        # Obtain length.
-        self._location.advance_cell()
-        field_length = items[3]
+        # Obtain length, which is validated later on after the field format has been created.
+        field_length = possibly_incomplete_items[3] if item_count > 3 else ''
 
         # Obtain field type and rule.
-        self._location.advance_cell()
-        field_type_item = items[4].strip()
+        self._location.advance_cell(2)
+        field_type_item = possibly_incomplete_items[4].strip() if item_count > 4 else ''
         if field_type_item == '':
             field_type = 'Text'
         else:
-            field_type = ''
-            field_type_parts = field_type_item.split(".")
             try:
-                for part in field_type_parts:
-                    if field_type:
-                        field_type += "."
-                    field_type += _tools.validated_python_name("field type part", part)
+                if '.' not in field_type_item:
+                    # Fast lane for the common case of a type without module, e.g. 'Integer'.
+                    field_type = _tools.validated_python_name("field type part", field_type_item)
+                else:
+                    field_type = '.'.join(
+                        _tools.validated_python_name("field type part", part)
+                        for part in field_type_item.split("."))
                 assert field_type, "empty field type must be detected by validated_python_name()"
             except NameError as error:
                 raise errors.InterfaceError(six.text_type(error), self._location)
         field_class = self._create_field_format_class(field_type)
         self._location.advance_cell()
-        field_rule = items[5].strip()
+        field_rule = possibly_incomplete_items[5].strip() if item_count > 5 else ''
         _log.debug("create field: %s(%r, %r, %r)", field_class.__name__, field_name, field_type, field_rule)
         try:
-            field_format = field_class.__new__(
-                field_class, field_name, field_is_allowed_to_be_empty, field_length, field_rule)
-            field_format.__init__(
+            field_format = field_class(
                 field_name, field_is_allowed_to_be_empty, field_length, field_rule, self._data_format)
         except errors.InterfaceError as error:
             error_location = error.location if error.location is not None else self._location
@@ -393,31 +506,7 @@ class Cid(object):
         # Validate field length.
         # TODO #82: Cleanup validation for declared field formats.
         self._location.set_cell(4)
-        field_length = field_format.length
-        if self._data_format.format == data.FORMAT_FIXED:
-            if field_length.items is None:
-                raise errors.InterfaceError(
-                    "length of field %s must be specified with fixed data format" % _compat.text_repr(field_name),
-                    self._location)
-            if field_length.lower_limit != field_length.upper_limit:
-                raise errors.InterfaceError(
-                    "length of field %s for fixed data format must be a specific number but is: %s"
-                    % (_compat.text_repr(field_name), field_format.length), self._location)
-            if field_length.lower_limit < 1:
-                raise errors.InterfaceError(
-                    "length of field %s for fixed data format must be at least 1 but is: %d"
-                    % (_compat.text_repr(field_name), field_format.length.lower_limit), self._location)
-        elif field_length.lower_limit is not None:
-            if field_length.lower_limit < 0:
-                raise errors.InterfaceError(
-                    "lower limit for length of field %s must be at least 0 but is: %d"
-                    % (_compat.text_repr(field_name), field_format.length.lower_limit), self._location)
-        elif field_length.upper_limit is not None:
-            # Note: 0 as upper limit is valid for a field that must always be empty.
-            if field_length.upper_limit < 0:
-                raise errors.InterfaceError(
-                    "upper limit for length of field %s must be at least 0 but is: %d"
-                    % (_compat.text_repr(field_name), field_format.length.upper_limit), self._location)
+        self._validate_field_length(field_name, field_format.length)
 
         # Set and validate example in case there is one.
         if field_example != '':
@@ -467,28 +556,30 @@ class Cid(object):
         """
         assert possibly_incomplete_items is not None
 
-        items = list(possibly_incomplete_items)
+        item_count = len(possibly_incomplete_items)
         # HACK: Ignore possible concatenated (empty) cells between description and type.
-        while (len(items) >= 2) and (items[1].strip() == ''):
-            del items[1]
-
-        check_description, check_type, check_rule = (items + 3 * [''])[:3]
+        check_type_index = 1
+        while (check_type_index < item_count) and (possibly_incomplete_items[check_type_index].strip() == ''):
+            check_type_index += 1
+        check_rule_index = check_type_index + 1
+
+        check_description = possibly_incomplete_items[0] if item_count > 0 else ''
+        check_type = possibly_incomplete_items[check_type_index] if check_type_index < item_count else ''
+        check_rule = possibly_incomplete_items[check_rule_index] if check_rule_index < item_count else ''
         self._location.advance_cell()
         if check_description == '':
             raise errors.InterfaceError(
                 'check description must be specified', self._location)
         self._location.advance_cell()
-        check_class_name = check_type + "Check"
-        if check_class_name not in self._check_name_to_class_map:
+        check_class = self._check_type_to_class_map.get(check_type)
+        if check_class is None:
             list_of_available_check_types = _tools.human_readable_list(sorted(self._check_name_to_class_map.keys()))
             raise errors.InterfaceError(
                 "check type is '%s' but must be one of: %s"
                 % (check_type, list_of_available_check_types),
                 self._location)
         _log.debug("create check: %s(%r, %r)", check_type, check_description, check_rule)
-        check_class = self._create_check_class(check_type)
-        check = check_class.__new__(check_class, check_description, check_rule, self._field_names, self._location)
-        check.__init__(check_description, check_rule, self._field_names, self._location)
+        check = check_class(check_description, check_rule, self._field_names, self._location)
         self._location.set_cell(1)
         existing_check = self._check_name_to_check_map.get(check_description)
         if existing_check is not None:
@@ -524,7 +615,7 @@ class Cid(object):
             % (field_name, _tools.human_readable_list(sorted(self.field_names)))
         assert row is not None
         actual_row_count = len(row)
-        expected_row_count = len(self.field_names)
+        expected_row_count = self._field_count
         assert actual_row_count == expected_row_count, \
             "row must have %d items but has %d: %s" % (expected_row_count, actual_row_count, row)
 
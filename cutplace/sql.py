@@ -20,6 +20,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import bisect
 import io
 import logging
 import os.path
@@ -44,7 +45,135 @@ TRANSACT = "Transact-SQL"
 #: SQL dialect name: PL/SQL used by Oracle
 PL = "PL/SQL"
 
-_INT_TYPES = set(['bigint', 'int', 'smallint', 'tinyint'])
+#: SQL types of integer numbers, which need no length in column definitions.
+_INT_TYPES = frozenset(['bigint', 'int', 'smallint', 'tinyint'])
+
+#: Upper limits of integer types in ascending order and the related type
+#: names for dialects that support several integer types.
+_TRANSACT_SQL_INT_LIMITS = (MAX_TINYINT, MAX_SMALLINT, MAX_INTEGER, MAX_BIGINT)
+_TRANSACT_SQL_INT_TYPE_NAMES = ('tinyint', 'smallint', 'int', 'bigint')
+_DB2_SQL_INT_LIMITS = (MAX_SMALLINT, MAX_INTEGER, MAX_BIGINT)
+_DB2_SQL_INT_TYPE_NAMES = ('smallint', 'integer', 'bigint')
+
+#: Keywords of the various SQL dialects, which have to be quoted when used as names.
+_ANSI_KEYWORDS = frozenset([
+    'absolute', 'action', 'add', 'after', 'all', 'allocate', 'alter', 'and', 'any', 'are', 'array', 'as', 'asc',
+    'asensitive', 'assertion', 'asymmetric', 'at', 'atomic', 'authorization', 'avg', 'before', 'begin', 'between',
+    'bigint', 'binary', 'bit', 'bit_length', 'blob', 'boolean', 'both', 'breadth', 'by', 'call', 'called',
+    'cascade', 'cascaded', 'case', 'cast', 'catalog', 'char', 'character', 'character_length', 'char_length',
+    'check', 'clob', 'close', 'coalesce', 'collate', 'collation', 'column', 'commit', 'condition', 'connect',
+    'connection', 'constraint', 'constraints', 'constructor', 'contains', 'continue', 'convert', 'corresponding',
+    'count', 'create', 'cross', 'cube', 'current', 'current_date', 'current_default_transform_group', 'current_path',
+    'current_role', 'current_time', 'current_timestamp', 'current_transform_group_for_type', 'current_user',
+    'cursor', 'cycle', 'data', 'date', 'day', 'deallocate', 'dec', 'decimal', 'declare', 'default', 'deferrable',
+    'deferred', 'delete', 'depth', 'deref', 'desc', 'describe', 'descriptor', 'deterministic', 'diagnostics',
+    'disconnect', 'distinct', 'do', 'domain', 'double', 'drop', 'dynamic', 'each', 'element', 'else', 'elseif',
+    'end', 'equals', 'escape', 'except', 'exception', 'exec', 'execute', 'exists', 'exit', 'external', 'extract',
+    'false', 'fetch', 'filter', 'first', 'float', 'for', 'foreign', 'found', 'free', 'from', 'full', 'function',
+    'general', 'get', 'global', 'go', 'goto', 'grant', 'group', 'grouping', 'handler', 'having', 'hold', 'hour',
+    'identity', 'if', 'immediate', 'in', 'indicator', 'initially', 'inner', 'inout', 'input', 'insensitive', 'insert',
+    'int', 'integer', 'intersect', 'interval', 'into', 'is', 'isolation', 'iterate', 'join', 'key', 'language',
+    'large', 'last', 'lateral', 'leading', 'leave', 'left', 'level', 'like', 'local', 'localtime', 'localtimestamp',
+    'locator', 'loop', 'lower', 'map', 'match', 'max', 'member', 'merge', 'method', 'min', 'minute', 'modifies',
+    'module', 'month', 'multiset', 'names', 'national', 'natural', 'nchar', 'nclob', 'new', 'next', 'no', 'none',
+    'not', 'null', 'nullif', 'numeric', 'object', 'octet_length', 'of', 'old', 'on', 'only', 'open', 'option',
+    'or', 'order', 'ordinality', 'out', 'outer', 'output', 'over', 'overlaps', 'pad', 'parameter', 'partial',
+    'partition', 'path', 'position', 'precision', 'prepare', 'preserve', 'primary', 'prior', 'privileges',
+    'procedure', 'public', 'range', 'read', 'reads', 'real', 'recursive', 'ref', 'references', 'referencing',
+    'relative', 'release', 'repeat', 'resignal', 'restrict', 'result', 'return', 'returns', 'revoke', 'right',
+    'role', 'rollback', 'rollup', 'routine', 'row', 'rows', 'savepoint', 'schema', 'scope', 'scroll', 'search',
+    'second', 'section', 'select', 'sensitive', 'session', 'session_user', 'set', 'sets', 'signal', 'similar',
+    'size', 'smallint', 'some', 'space', 'specific', 'specifictype', 'sql', 'sqlcode', 'sqlerror', 'sqlexception',
+    'sqlstate', 'sqlwarning', 'start', 'state', 'static', 'submultiset', 'substring', 'sum', 'symmetric', 'system',
+    'system_user', 'table', 'tablesample', 'temporary', 'then', 'time', 'timestamp', 'timezone_hour', 'timezone_minute',
+    'to', 'trailing', 'transaction', 'translate', 'translation', 'treat', 'trigger', 'trim', 'true', 'under', 'undo',
+    'union', 'unique', 'unknown', 'unnest', 'until', 'update', 'upper', 'usage', 'user', 'using', 'value', 'values',
+    'varchar', 'varying', 'view', 'when', 'whenever', 'where', 'while', 'window', 'with', 'within', 'without',
+    'work', 'write', 'year', 'zone'])
+
+_PL_SQL_KEYWORDS = frozenset([
+    'a', 'add', 'agent', 'aggregate', 'all', 'alter', 'and', 'any', 'array', 'arrow', 'as',
+    'asc', 'at', 'attribute', 'authid', 'avg', 'begin', 'between', 'bfile_base', 'binary', 'blob_base', 'block',
+    'body', 'both', 'bound', 'bulk', 'by', 'byte', 'c', 'call', 'calling', 'cascade', 'case', 'char', 'character',
+    'charset', 'charsetform', 'charsetid', 'char_base', 'check', 'clob_base', 'close', 'cluster', 'clusters',
+    'colauth', 'collect', 'columns', 'comment', 'commit', 'committed', 'compiled', 'compress', 'connect', 'constant',
+    'constructor', 'context', 'convert', 'count', 'crash', 'create', 'current', 'cursor', 'customdatum', 'dangling',
+    'data', 'date', 'date_base', 'day', 'decimal', 'declare', 'default', 'define', 'delete', 'desc', 'deterministic',
+    'distinct', 'double', 'drop', 'duration', 'element', 'else', 'elsif', 'empty', 'end', 'escape', 'except',
+    'exception', 'exceptions', 'exclusive', 'execute', 'exists', 'exit', 'external', 'fetch', 'final', 'fixed',
+    'float', 'for', 'forall', 'force', 'form', 'from', 'function', 'general', 'goto', 'grant', 'group', 'hash',
+    'having', 'heap', 'hidden', 'hour', 'identified', 'if', 'immediate', 'in', 'including', 'index', 'indexes',
+    'indicator', 'indices', 'infinite', 'insert', 'instantiable', 'int', 'interface', 'intersect', 'interval',
+    'into', 'invalidate', 'is', 'isolation', 'java', 'language', 'large', 'leading', 'length', 'level', 'library',
+    'like', 'like2', 'like4', 'likec', 'limit', 'limited', 'local', 'lock', 'long', 'loop', 'map', 'max', 'maxlen',
+    'member', 'merge', 'min', 'minus', 'minute', 'mod', 'mode', 'modify', 'month', 'multiset', 'name', 'nan',
+    'national', 'native', 'nchar', 'new', 'nocompress', 'nocopy', 'not', 'nowait', 'null', 'number_base', 'object',
+    'ocicoll', 'ocidate', 'ocidatetime', 'ociduration', 'ociinterval', 'ociloblocator', 'ocinumber', 'ociraw',
+    'ociref', 'ocirefcursor', 'ocirowid', 'ocistring', 'ocitype', 'of', 'on', 'only', 'opaque', 'open', 'operator',
+    'option', 'or', 'oracle', 'oradata', 'order,overlaps', 'organization', 'orlany', 'orlvary', 'others', 'out',
+    'overriding', 'package', 'parallel_enable', 'parameter', 'parameters', 'partition', 'pascal', 'pipe',
+    'pipelined', 'pragma', 'precision', 'prior', 'private', 'procedure', 'public', 'raise', 'range', 'raw', 'read',
+    'record', 'ref', 'reference', 'rem', 'remainder', 'rename', 'resource', 'result', 'return', 'returning',
+    'reverse', 'revoke', 'rollback', 'row', 'sample', 'save', 'savepoint', 'sb1', 'sb2', 'sb4', 'second', 'segment',
+    'select', 'self', 'separate', 'sequence', 'serializable', 'set', 'share', 'short', 'size', 'size_t', 'some',
+    'sparse', 'sql', 'sqlcode', 'sqldata', 'sqlname', 'sqlstate', 'standard', 'start', 'static', 'stddev', 'stored',
+    'string', 'struct', 'style', 'submultiset', 'subpartition', 'substitutable', 'subtype', 'sum', 'synonym',
+    'tabauth', 'table', 'tdo', 'the', 'then', 'time', 'timestamp', 'timezone_abbr', 'timezone_hour', 'timezone_minute',
+    'timezone_region', 'to', 'trailing', 'transac', 'transactional', 'trusted', 'type', 'ub1', 'ub2', 'ub4', 'under',
+    'union', 'unique', 'unsigned', 'untrusted', 'update', 'use', 'using', 'valist', 'value', 'values', 'variable',
+    'variance', 'varray', 'varying', 'view', 'views', 'void', 'when', 'where', 'while', 'with', 'work', 'wrapped',
+    'write', 'year', 'zone'])
+
+_TRANSACT_SQL_KEYWORDS = frozenset([
+    'add', 'all', 'alter', 'and', 'any', 'as', 'asc', 'authorization', 'backup', 'begin', 'between', 'break',
+    'browse', 'bulk', 'by', 'cascade', 'case', 'check', 'checkpoint', 'close', 'clustered', 'coalesce', 'collate',
+    'column', 'commit', 'compute', 'constraint', 'contains', 'containstable', 'continue', 'convert', 'create',
+    'cross', 'current', 'current_date', 'current_time', 'current_timestamp', 'current_user', 'cursor', 'database',
+    'dbcc', 'deallocate', 'declare', 'default', 'delete', 'deny', 'desc', 'disk', 'distinct', 'distributed',
+    'double', 'drop', 'dump', 'else', 'end', 'errlvl', 'escape', 'except', 'exec', 'execute', 'exists', 'exit',
+    'external', 'fetch', 'file', 'fillfactor', 'for', 'foreign', 'freetext', 'freetexttable', 'from', 'full',
+    'function', 'goto', 'grant', 'group', 'having', 'holdlock', 'identity', 'identitycol', 'identity_insert',
+    'if', 'in', 'index', 'inner', 'insert', 'intersect', 'into', 'is', 'join', 'key', 'kill', 'left', 'like',
+    'lineno', 'load', 'merge', 'national', 'nocheck', 'nonclustered', 'not', 'null', 'nullif', 'of', 'off',
+    'offsets', 'on', 'open', 'opendatasource', 'openquery', 'openrowset', 'openxml', 'option', 'or', 'order',
+    'outer', 'over', 'percent', 'pivot', 'plan', 'precision', 'primary', 'print', 'proc', 'procedure', 'public',
+    'raiserror', 'read', 'readtext', 'reconfigure', 'references', 'replication', 'restore', 'restrict', 'return',
+    'revert', 'revoke', 'right', 'rollback', 'rowcount', 'rowguidcol', 'rule', 'save', 'schema', 'securityaudit',
+    'select', 'semantickeyphrasetable', 'semanticsimilaritydetailstable', 'semanticsimilaritytable', 'session_user',
+    'set', 'setuser', 'shutdown', 'some', 'statistics', 'system_user', 'table', 'tablesample', 'textsize', 'then',
+    'to', 'top', 'tran', 'transaction', 'trigger', 'truncate', 'try_convert', 'tsequal', 'union', 'unique', 'unpivot',
+    'update', 'updatetext', 'use', 'user', 'values', 'varying', 'view', 'waitfor', 'when', 'where', 'while', 'with',
+    'withingroup', 'writetext'])
+
+_DB2_SQL_KEYWORDS = frozenset([
+    'add', 'after', 'all', 'allocate', 'allow', 'alter', 'and', 'any', 'as', 'asensitive', 'associate', 'asutime',
+    'at', 'audit', 'aux', 'auxiliary', 'before', 'begin', 'between', 'bufferpool', 'by', 'call', 'capture',
+    'cascaded', 'case', 'cast', 'ccsid', 'char', 'character', 'check', 'clone', 'close', 'cluster', 'collection',
+    'collid', 'column', 'comment', 'commit', 'concat', 'condition', 'connect', 'connection', 'constraint',
+    'contains', 'content', 'continue', 'create', 'current', 'current_date', 'current_lc_ctype', 'current_path',
+    'current_schema', 'current_time', 'current_timestamp', 'currval1', 'cursor', 'data', 'database', 'day', 'days',
+    'dbinfo', 'declare', 'default', 'delete', 'descriptor', 'deterministic', 'disable', 'disallow', 'distinct',
+    'do', 'document', 'double', 'drop', 'dssize', 'dynamic', 'editproc', 'else', 'elseif', 'encoding', 'encryption',
+    'end', 'end-exec2', 'ending', 'erase', 'escape', 'except', 'exception', 'execute', 'exists', 'exit', 'explain',
+    'external', 'fenced', 'fetch', 'fieldproc', 'final', 'first1', 'for', 'free', 'from', 'full', 'function',
+    'generated', 'get', 'global', 'go', 'goto', 'grant', 'group', 'handler', 'having', 'hold', 'hour', 'hours',
+    'if', 'immediate', 'in', 'inclusive', 'index', 'inherit', 'inner', 'inout', 'insensitive', 'insert', 'intersect',
+    'into', 'is', 'isobid', 'iterate', 'jar', 'join', 'keep', 'key', 'label', 'language', 'last1', 'lc_ctype',
+    'leave', 'left', 'like', 'local', 'locale', 'locator', 'locators', 'lock', 'lockmax', 'locksize', 'long', 'loop',
+    'maintained', 'materialized', 'microsecond', 'microseconds', 'minute', 'minutes', 'modifies', 'month', 'months',
+    'next1', 'nextval', 'no', 'none', 'not', 'null', 'nulls', 'numparts', 'obid', 'of', 'old1', 'on', 'open',
+    'optimization', 'optimize', 'or', 'order', 'organization1', 'out', 'outer', 'package', 'padded', 'parameter',
+    'part', 'partition', 'partitioned', 'partitioning', 'path', 'period1', 'piecesize', 'plan', 'precision',
+    'prepare', 'prevval', 'prior1', 'priqty', 'privileges', 'procedure', 'program', 'psid', 'public', 'query',
+    'queryno', 'reads', 'references', 'refresh', 'release', 'rename', 'repeat', 'resignal', 'restrict', 'result',
+    'result_set_locator', 'return', 'returns', 'revoke', 'right', 'role', 'rollback', 'round_ceiling', 'round_down',
+    'round_floor', 'round_half_down', 'round_half_even', 'round_half_up', 'round_up', 'row', 'rowset', 'run',
+    'savepoint', 'schema', 'scratchpad', 'second', 'seconds', 'secqty', 'security', 'select', 'sensitive', 'sequence',
+    'session_user', 'set', 'signal', 'simple', 'some', 'source', 'specific', 'standard', 'statement', 'static', 'stay',
+    'stogroup', 'stores', 'style', 'summary', 'synonym', 'sysdate1', 'system', 'systimestamp1', 'table', 'tablespace',
+    'then', 'to', 'trigger', 'truncate', 'type', 'undo', 'union', 'unique', 'until', 'update', 'user', 'using',
+    'validproc', 'value', 'values', 'variable', 'variant', 'vcat', 'view', 'volatile', 'volumes', 'when', 'whenever',
+    'where', 'while', 'with', 'wlm', 'xmlcast', 'xmlexists', 'xmlnamespaces', 'year', 'years', 'zone'])
 
 _log = logging.getLogger("cutplace")
 
@@ -55,41 +184,7 @@ class AnsiSqlDialect():
     ANSI SQL dialect basically but not really supported by several database vendors.
     """
     def __init__(self):
-        keywords_as_list = [
-            'absolute', 'action', 'add', 'after', 'all', 'allocate', 'alter', 'and', 'any', 'are', 'array', 'as', 'asc',
-            'asensitive', 'assertion', 'asymmetric', 'at', 'atomic', 'authorization', 'avg', 'before', 'begin', 'between',
-            'bigint', 'binary', 'bit', 'bit_length', 'blob', 'boolean', 'both', 'breadth', 'by', 'call', 'called',
-            'cascade', 'cascaded', 'case', 'cast', 'catalog', 'char', 'character', 'character_length', 'char_length',
-            'check', 'clob', 'close', 'coalesce', 'collate', 'collation', 'column', 'commit', 'condition', 'connect',
-            'connection', 'constraint', 'constraints', 'constructor', 'contains', 'continue', 'convert', 'corresponding',
-            'count', 'create', 'cross', 'cube', 'current', 'current_date', 'current_default_transform_group', 'current_path',
-            'current_role', 'current_time', 'current_timestamp', 'current_transform_group_for_type', 'current_user',
-            'cursor', 'cycle', 'data', 'date', 'day', 'deallocate', 'dec', 'decimal', 'declare', 'default', 'deferrable',
-            'deferred', 'delete', 'depth', 'deref', 'desc', 'describe', 'descriptor', 'deterministic', 'diagnostics',
-            'disconnect', 'distinct', 'do', 'domain', 'double', 'drop', 'dynamic', 'each', 'element', 'else', 'elseif',
-            'end', 'equals', 'escape', 'except', 'exception', 'exec', 'execute', 'exists', 'exit', 'external', 'extract',
-            'false', 'fetch', 'filter', 'first', 'float', 'for', 'foreign', 'found', 'free', 'from', 'full', 'function',
-            'general', 'get', 'global', 'go', 'goto', 'grant', 'group', 'grouping', 'handler', 'having', 'hold', 'hour',
-            'identity', 'if', 'immediate', 'in', 'indicator', 'initially', 'inner', 'inout', 'input', 'insensitive', 'insert',
-            'int', 'integer', 'intersect', 'interval', 'into', 'is', 'isolation', 'iterate', 'join', 'key', 'language',
-            'large', 'last', 'lateral', 'leading', 'leave', 'left', 'level', 'like', 'local', 'localtime', 'localtimestamp',
-            'locator', 'loop', 'lower', 'map', 'match', 'max', 'member', 'merge', 'method', 'min', 'minute', 'modifies',
-            'module', 'month', 'multiset', 'names', 'national', 'natural', 'nchar', 'nclob', 'new', 'next', 'no', 'none',
-            'not', 'null', 'nullif', 'numeric', 'object', 'octet_length', 'of', 'old', 'on', 'only', 'open', 'option',
-            'or', 'order', 'ordinality', 'out', 'outer', 'output', 'over', 'overlaps', 'pad', 'parameter', 'partial',
-            'partition', 'path', 'position', 'precision', 'prepare', 'preserve', 'primary', 'prior', 'privileges',
-            'procedure', 'public', 'range', 'read', 'reads', 'real', 'recursive', 'ref', 'references', 'referencing',
-            'relative', 'release', 'repeat', 'resignal', 'restrict', 'result', 'return', 'returns', 'revoke', 'right',
-            'role', 'rollback', 'rollup', 'routine', 'row', 'rows', 'savepoint', 'schema', 'scope', 'scroll', 'search',
-            'second', 'section', 'select', 'sensitive', 'session', 'session_user', 'set', 'sets', 'signal', 'similar',
-            'size', 'smallint', 'some', 'space', 'specific', 'specifictype', 'sql', 'sqlcode', 'sqlerror', 'sqlexception',
-            'sqlstate', 'sqlwarning', 'start', 'state', 'static', 'submultiset', 'substring', 'sum', 'symmetric', 'system',
-            'system_user', 'table', 'tablesample', 'temporary', 'then', 'time', 'timestamp', 'timezone_hour', 'timezone_minute',
-            'to', 'trailing', 'transaction', 'translate', 'translation', 'treat', 'trigger', 'trim', 'true', 'under', 'undo',
-            'union', 'unique', 'unknown', 'unnest', 'until', 'update', 'upper', 'usage', 'user', 'using', 'value', 'values',
-            'varchar', 'varying', 'view', 'when', 'whenever', 'where', 'while', 'window', 'with', 'within', 'without',
-            'work', 'write', 'year', 'zone']
-        self._keywords = set(keywords_as_list)
+        self._keywords = _ANSI_KEYWORDS
 
     @property
     def keywords(self):
@@ -109,71 +204,52 @@ class AnsiSqlDialect():
 
     def is_keyword(self, word):
         assert word is not None
-        return word.lower() in self.keywords
+        return word.lower() in self._keywords
 
     def __str__(self):
         return ANSI
 
 
+def _pl_sql_decimal_type(sql_ansi_type):
+    _, scale, precision = sql_ansi_type
+    return ('number', scale, precision)
+
+
+def _pl_sql_int_type(sql_ansi_type):
+    length = sql_ansi_type[1]
+    if length > MAX_INTEGER:
+        result = ('number', length, 0)
+    else:
+        result = sql_ansi_type
+    return result
+
+
+def _pl_sql_varchar_type(sql_ansi_type):
+    return ('varchar2', sql_ansi_type[1])
+
+
+#: Functions to map ANSI SQL types to PL/SQL types that differ.
+_ANSI_TYPE_NAME_TO_PL_SQL_TYPE_MAP = {
+    'decimal': _pl_sql_decimal_type,
+    'int': _pl_sql_int_type,
+    'varchar': _pl_sql_varchar_type,
+}
+
+
 @python_2_unicode_compatible
 class PlSqlDialect(AnsiSqlDialect):
     """
     PL/SQL dialect used by Oracle.
     """
     def __init__(self):
-        keywords_as_list = [
-            'a', 'add', 'agent', 'aggregate', 'all', 'alter', 'and', 'any', 'array', 'arrow', 'as',
-            'asc', 'at', 'attribute', 'authid', 'avg', 'begin', 'between', 'bfile_base', 'binary', 'blob_base', 'block',
-            'body', 'both', 'bound', 'bulk', 'by', 'byte', 'c', 'call', 'calling', 'cascade', 'case', 'char', 'character',
-            'charset', 'charsetform', 'charsetid', 'char_base', 'check', 'clob_base', 'close', 'cluster', 'clusters',
-            'colauth', 'collect', 'columns', 'comment', 'commit', 'committed', 'compiled', 'compress', 'connect', 'constant',
-            'constructor', 'context', 'convert', 'count', 'crash', 'create', 'current', 'cursor', 'customdatum', 'dangling',
-            'data', 'date', 'date_base', 'day', 'decimal', 'declare', 'default', 'define', 'delete', 'desc', 'deterministic',
-            'distinct', 'double', 'drop', 'duration', 'element', 'else', 'elsif', 'empty', 'end', 'escape', 'except',
-            'exception', 'exceptions', 'exclusive', 'execute', 'exists', 'exit', 'external', 'fetch', 'final', 'fixed',
-            'float', 'for', 'forall', 'force', 'form', 'from', 'function', 'general', 'goto', 'grant', 'group', 'hash',
-            'having', 'heap', 'hidden', 'hour', 'identified', 'if', 'immediate', 'in', 'including', 'index', 'indexes',
-            'indicator', 'indices', 'infinite', 'insert', 'instantiable', 'int', 'interface', 'intersect', 'interval',
-            'into', 'invalidate', 'is', 'isolation', 'java', 'language', 'large', 'leading', 'length', 'level', 'library',
-            'like', 'like2', 'like4', 'likec', 'limit', 'limited', 'local', 'lock', 'long', 'loop', 'map', 'max', 'maxlen',
-            'member', 'merge', 'min', 'minus', 'minute', 'mod', 'mode', 'modify', 'month', 'multiset', 'name', 'nan',
-            'national', 'native', 'nchar', 'new', 'nocompress', 'nocopy', 'not', 'nowait', 'null', 'number_base', 'object',
-            'ocicoll', 'ocidate', 'ocidatetime', 'ociduration', 'ociinterval', 'ociloblocator', 'ocinumber', 'ociraw',
-            'ociref', 'ocirefcursor', 'ocirowid', 'ocistring', 'ocitype', 'of', 'on', 'only', 'opaque', 'open', 'operator',
-            'option', 'or', 'oracle', 'oradata', 'order,overlaps', 'organization', 'orlany', 'orlvary', 'others', 'out',
-            'overriding', 'package', 'parallel_enable', 'parameter', 'parameters', 'partition', 'pascal', 'pipe',
-            'pipelined', 'pragma', 'precision', 'prior', 'private', 'procedure', 'public', 'raise', 'range', 'raw', 'read',
-            'record', 'ref', 'reference', 'rem', 'remainder', 'rename', 'resource', 'result', 'return', 'returning',
-            'reverse', 'revoke', 'rollback', 'row', 'sample', 'save', 'savepoint', 'sb1', 'sb2', 'sb4', 'second', 'segment',
-            'select', 'self', 'separate', 'sequence', 'serializable', 'set', 'share', 'short', 'size', 'size_t', 'some',
-            'sparse', 'sql', 'sqlcode', 'sqldata', 'sqlname', 'sqlstate', 'standard', 'start', 'static', 'stddev', 'stored',
-            'string', 'struct', 'style', 'submultiset', 'subpartition', 'substitutable', 'subtype', 'sum', 'synonym',
-            'tabauth', 'table', 'tdo', 'the', 'then', 'time', 'timestamp', 'timezone_abbr', 'timezone_hour', 'timezone_minute',
-            'timezone_region', 'to', 'trailing', 'transac', 'transactional', 'trusted', 'type', 'ub1', 'ub2', 'ub4', 'under',
-            'union', 'unique', 'unsigned', 'untrusted', 'update', 'use', 'using', 'valist', 'value', 'values', 'variable',
-            'variance', 'varray', 'varying', 'view', 'views', 'void', 'when', 'where', 'while', 'with', 'work', 'wrapped',
-            'write', 'year', 'zone']
-        self._keywords = set(keywords_as_list)
+        self._keywords = _PL_SQL_KEYWORDS
 
     def sql_type(self, sql_ansi_type):
-        ansi_type = sql_ansi_type[0]
-        result = sql_ansi_type
-
-        if ansi_type == 'decimal':
-            oracle_type = 'number'
-            _, scale, precision = sql_ansi_type
-            result = (oracle_type, scale, precision)
-
-        elif ansi_type == 'varchar':
-            oracle_type = 'varchar2'
-            length = sql_ansi_type[1]
-            result = (oracle_type, length)
-
-        elif ansi_type == 'int':
-            length = sql_ansi_type[1]
-            if length > MAX_INTEGER:
-                result = ('number', length, 0)
-
+        pl_sql_type = _ANSI_TYPE_NAME_TO_PL_SQL_TYPE_MAP.get(sql_ansi_type[0])
+        if pl_sql_type is None:
+            result = sql_ansi_type
+        else:
+            result = pl_sql_type(sql_ansi_type)
         return result
 
     def __str__(self):
@@ -186,27 +262,7 @@ class TransactSqlDialect(AnsiSqlDialect):
     Transact-SQL dialect used by Microsoft SQL Server and Sybase.
     """
     def __init__(self):
-        keywords = [
-            'add', 'all', 'alter', 'and', 'any', 'as', 'asc', 'authorization', 'backup', 'begin', 'between', 'break',
-            'browse', 'bulk', 'by', 'cascade', 'case', 'check', 'checkpoint', 'close', 'clustered', 'coalesce', 'collate',
-            'column', 'commit', 'compute', 'constraint', 'contains', 'containstable', 'continue', 'convert', 'create',
-            'cross', 'current', 'current_date', 'current_time', 'current_timestamp', 'current_user', 'cursor', 'database',
-            'dbcc', 'deallocate', 'declare', 'default', 'delete', 'deny', 'desc', 'disk', 'distinct', 'distributed',
-            'double', 'drop', 'dump', 'else', 'end', 'errlvl', 'escape', 'except', 'exec', 'execute', 'exists', 'exit',
-            'external', 'fetch', 'file', 'fillfactor', 'for', 'foreign', 'freetext', 'freetexttable', 'from', 'full',
-            'function', 'goto', 'grant', 'group', 'having', 'holdlock', 'identity', 'identitycol', 'identity_insert',
-            'if', 'in', 'index', 'inner', 'insert', 'intersect', 'into', 'is', 'join', 'key', 'kill', 'left', 'like',
-            'lineno', 'load', 'merge', 'national', 'nocheck', 'nonclustered', 'not', 'null', 'nullif', 'of', 'off',
-            'offsets', 'on', 'open', 'opendatasource', 'openquery', 'openrowset', 'openxml', 'option', 'or', 'order',
-            'outer', 'over', 'percent', 'pivot', 'plan', 'precision', 'primary', 'print', 'proc', 'procedure', 'public',
-            'raiserror', 'read', 'readtext', 'reconfigure', 'references', 'replication', 'restore', 'restrict', 'return',
-            'revert', 'revoke', 'right', 'rollback', 'rowcount', 'rowguidcol', 'rule', 'save', 'schema', 'securityaudit',
-            'select', 'semantickeyphrasetable', 'semanticsimilaritydetailstable', 'semanticsimilaritytable', 'session_user',
-            'set', 'setuser', 'shutdown', 'some', 'statistics', 'system_user', 'table', 'tablesample', 'textsize', 'then',
-            'to', 'top', 'tran', 'transaction', 'trigger', 'truncate', 'try_convert', 'tsequal', 'union', 'unique', 'unpivot',
-            'update', 'updatetext', 'use', 'user', 'values', 'varying', 'view', 'waitfor', 'when', 'where', 'while', 'with',
-            'withingroup', 'writetext']
-        self._keywords = set(keywords)
+        self._keywords = _TRANSACT_SQL_KEYWORDS
 
     def sql_type(self, sql_ansi_type):
         ansi_type = sql_ansi_type[0]
@@ -214,14 +270,9 @@ class TransactSqlDialect(AnsiSqlDialect):
             limit = sql_ansi_type[1]
             assert limit >= 0, 'length=%r' % limit
 
-            if limit <= MAX_TINYINT:
-                result = ('tinyint', limit)
-            elif limit <= MAX_SMALLINT:
-                result = ('smallint', limit)
-            elif limit <= MAX_INTEGER or limit is None:
-                result = ('int', limit)
-            elif limit <= MAX_BIGINT:
-                result = ('bigint', limit)
+            int_type_index = bisect.bisect_left(_TRANSACT_SQL_INT_LIMITS, limit)
+            if int_type_index < len(_TRANSACT_SQL_INT_TYPE_NAMES):
+                result = (_TRANSACT_SQL_INT_TYPE_NAMES[int_type_index], limit)
             else:
                 result = ('decimal', limit, 0)
         else:
@@ -239,48 +290,16 @@ class Db2SqlDialect(AnsiSqlDialect):
     SQL dialect used by IBM DB2.
     """
     def __init__(self):
-        keywords = [
-            'add', 'after', 'all', 'allocate', 'allow', 'alter', 'and', 'any', 'as', 'asensitive', 'associate', 'asutime',
-            'at', 'audit', 'aux', 'auxiliary', 'before', 'begin', 'between', 'bufferpool', 'by', 'call', 'capture',
-            'cascaded', 'case', 'cast', 'ccsid', 'char', 'character', 'check', 'clone', 'close', 'cluster', 'collection',
-            'collid', 'column', 'comment', 'commit', 'concat', 'condition', 'connect', 'connection', 'constraint',
-            'contains', 'content', 'continue', 'create', 'current', 'current_date', 'current_lc_ctype', 'current_path',
-            'current_schema', 'current_time', 'current_timestamp', 'currval1', 'cursor', 'data', 'database', 'day', 'days',
-            'dbinfo', 'declare', 'default', 'delete', 'descriptor', 'deterministic', 'disable', 'disallow', 'distinct',
-            'do', 'document', 'double', 'drop', 'dssize', 'dynamic', 'editproc', 'else', 'elseif', 'encoding', 'encryption',
-            'end', 'end-exec2', 'ending', 'erase', 'escape', 'except', 'exception', 'execute', 'exists', 'exit', 'explain',
-            'external', 'fenced', 'fetch', 'fieldproc', 'final', 'first1', 'for', 'free', 'from', 'full', 'function',
-            'generated', 'get', 'global', 'go', 'goto', 'grant', 'group', 'handler', 'having', 'hold', 'hour', 'hours',
-            'if', 'immediate', 'in', 'inclusive', 'index', 'inherit', 'inner', 'inout', 'insensitive', 'insert', 'intersect',
-            'into', 'is', 'isobid', 'iterate', 'jar', 'join', 'keep', 'key', 'label', 'language', 'last1', 'lc_ctype',
-            'leave', 'left', 'like', 'local', 'locale', 'locator', 'locators', 'lock', 'lockmax', 'locksize', 'long', 'loop',
-            'maintained', 'materialized', 'microsecond', 'microseconds', 'minute', 'minutes', 'modifies', 'month', 'months',
-            'next1', 'nextval', 'no', 'none', 'not', 'null', 'nulls', 'numparts', 'obid', 'of', 'old1', 'on', 'open',
-            'optimization', 'optimize', 'or', 'order', 'organization1', 'out', 'outer', 'package', 'padded', 'parameter',
-            'part', 'partition', 'partitioned', 'partitioning', 'path', 'period1', 'piecesize', 'plan', 'precision',
-            'prepare', 'prevval', 'prior1', 'priqty', 'privileges', 'procedure', 'program', 'psid', 'public', 'query',
-            'queryno', 'reads', 'references', 'refresh', 'release', 'rename', 'repeat', 'resignal', 'restrict', 'result',
-            'result_set_locator', 'return', 'returns', 'revoke', 'right', 'role', 'rollback', 'round_ceiling', 'round_down',
-            'round_floor', 'round_half_down', 'round_half_even', 'round_half_up', 'round_up', 'row', 'rowset', 'run',
-            'savepoint', 'schema', 'scratchpad', 'second', 'seconds', 'secqty', 'security', 'select', 'sensitive', 'sequence',
-            'session_user', 'set', 'signal', 'simple', 'some', 'source', 'specific', 'standard', 'statement', 'static', 'stay',
-            'stogroup', 'stores', 'style', 'summary', 'synonym', 'sysdate1', 'system', 'systimestamp1', 'table', 'tablespace',
-            'then', 'to', 'trigger', 'truncate', 'type', 'undo', 'union', 'unique', 'until', 'update', 'user', 'using',
-            'validproc', 'value', 'values', 'variable', 'variant', 'vcat', 'view', 'volatile', 'volumes', 'when', 'whenever',
-            'where', 'while', 'with', 'wlm', 'xmlcast', 'xmlexists', 'xmlnamespaces', 'year', 'years', 'zone']
-        self._keywords = set(keywords)
+        self._keywords = _DB2_SQL_KEYWORDS
 
     def sql_type(self, sql_ansi_type):
         ansi_type = sql_ansi_type[0]
         result = sql_ansi_type
         if ansi_type == 'int':
             length = sql_ansi_type[1]
-            if length <= MAX_SMALLINT:
-                result = ('smallint', length)
-            elif length <= MAX_INTEGER or length is None:
-                result = ('integer', length)
-            elif length <= MAX_BIGINT:
-                result = ('bigint', length)
+            int_type_index = bisect.bisect_left(_DB2_SQL_INT_LIMITS, length)
+            if int_type_index < len(_DB2_SQL_INT_TYPE_NAMES):
+                result = (_DB2_SQL_INT_TYPE_NAMES[int_type_index], length)
             else:
                 result = ('decimal', length)
         return result
@@ -349,7 +368,7 @@ def write_create(cid_path, cid_reader):
         # TODO: Add option for encoding.
         table = os.path.splitext(os.path.basename(cid_path))[0]
         sql_factory = SqlFactory(cid_reader, table)
-        create_file.write(sql_factory.create_table_statement())
+        create_file.writelines(sql_factory.create_table_statement_parts())
         # TODO: Add option for target SQL dialect
 
 
@@ -372,8 +391,9 @@ class SqlFactory(object):
         Tuples `(field_name, field_type, length, precision, is_not_null, default_value)`
         """
         for field in self._cid.field_formats:
-            assert_is_valid_ansi_type(field.sql_ansi_type())
-            sql_type, sql_length, sql_precision = (field.sql_ansi_type() + (None, None))[:3]
+            sql_ansi_type = field.sql_ansi_type()
+            assert_is_valid_ansi_type(sql_ansi_type)
+            sql_type, sql_length, sql_precision = (sql_ansi_type + (None, None))[:3]
             sql_type, sql_length, sql_precision = (
                 self._dialect.sql_type((sql_type, sql_length, sql_precision)) + (None, None))[:3]
             field_name = field.field_name
@@ -383,36 +403,84 @@ class SqlFactory(object):
                    field.empty_value)
             yield row
 
-    def create_table_statement(self):
-        result = "create table " + self._table + " (\n"
-        first_field = True
-
-        # get column definitions for all fields
+    def _column_defs(self):
+        """
+        Column definitions for all fields to be used in a create table
+        statement.
+        """
         for field_name, field_type, length, precision, is_not_null, default_value in self.sql_fields():
-            if not first_field:
-                result += ",\n"
-
-            column_def = self._indent + field_name + " " + field_type
+            column_def_parts = [self._indent, field_name, " ", field_type]
             if field_type not in _INT_TYPES:
                 if length is not None and precision is None:
-                    column_def += "(" + six.text_type(length) + ")"
+                    column_def_parts.append("(%s)" % length)
                 elif length is not None and precision is not None:
-                    column_def += "(" + six.text_type(length) + ", " + six.text_type(precision) + ")"
+                    column_def_parts.append("(%s, %s)" % (length, precision))
 
             if not is_not_null:
-                column_def += " not null"
+                column_def_parts.append(" not null")
 
             if default_value is not None and len(default_value) > 0:
-                column_def += " default " + six.text_type(default_value)
+                column_def_parts.append(" default %s" % default_value)
 
-            result += column_def
+            yield "".join(column_def_parts)
 
-            if first_field:
-                first_field = False
+    def create_table_statement_parts(self):
+        """
+        Parts of :py:meth:`create_table_statement()` with one part for
+        each column so they can be written one after another without
+        building the whole statement in memory.
+        """
+        yield "create table %s (\n" % self._table
+        column_separator = ""
+        for column_def in self._column_defs():
+            yield column_separator + column_def
+            column_separator = ",\n"
+        yield "\n);"
 
-        result += "\n);"
+    def create_table_statement(self):
+        return "".join(self.create_table_statement_parts())
 
-        return result
+    def insert_statement_and_row_chunks(self, rows, chunk_size=1000, placeholder='?'):
+        """
+        Pairs ``(insert_statement, row_chunk)`` to insert ``rows`` in the
+        table. The ``insert_statement`` uses ``placeholder`` for the values,
+        which has to match the ``paramstyle`` of the database module, for
+        example the default question mark (?) for ``qmark`` as used by
+        :py:mod:`sqlite3` or '%s' for ``format`` as used by most MySQL
+        modules. Each ``row_chunk`` is a list of at most ``chunk_size``
+        tuples where empty values of fields that are allowed to be empty
+        are ``None`` so they end up as NULL. Both can be passed to
+        :py:meth:`cursor.executemany()` so the database has to parse the
+        statement only once for each chunk.
+
+        :raises AssertionError: if a row does not have the expected number \
+          of items
+        """
+        assert rows is not None
+        assert chunk_size >= 1
+        assert placeholder is not None
+
+        field_names = []
+        is_allowed_to_be_empty_flags = []
+        for sql_field in self.sql_fields():
+            field_names.append(sql_field[0])
+            is_allowed_to_be_empty_flags.append(sql_field[4])
+        insert_statement = "insert into %s (%s) values (%s)" % (
+            self._table, ", ".join(field_names), ", ".join([placeholder] * len(field_names)))
+        expected_row_count = len(field_names)
+        row_chunk = []
+        for row in rows:
+            actual_row_count = len(row)
+            assert actual_row_count == expected_row_count, \
+                "row must have %d items but has %d: %s" % (expected_row_count, actual_row_count, row)
+            row_chunk.append(tuple(
+                None if (is_allowed_to_be_empty and value == '') else value
+                for value, is_allowed_to_be_empty in zip(row, is_allowed_to_be_empty_flags)))
+            if len(row_chunk) == chunk_size:
+                yield insert_statement, row_chunk
+                row_chunk = []
+        if row_chunk:
+            yield insert_statement, row_chunk
 
     def create_index_statements(self):
         pass
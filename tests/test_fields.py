@@ -382,6 +382,17 @@ class ChoiceFieldFormatTest(unittest.TestCase):
         self.assertEqual(field_format.validated("red"), "red")
         self.assertEqual(field_format.validated(""), "")
 
+    def test_can_match_multi_character_operator_choices(self):
+        field_format = fields.ChoiceFieldFormat("comparison", False, None, "<, <=, >", _ANY_FORMAT)
+        self.assertEqual(field_format.choices, ["<", "<=", ">"])
+        self.assertEqual(field_format.validated("<="), "<=")
+
+    def test_can_share_rule_between_fields(self):
+        field_format = fields.ChoiceFieldFormat("color", False, None, "red, green", _ANY_FORMAT)
+        other_field_format = fields.ChoiceFieldFormat("other_color", False, None, "red, green", _ANY_FORMAT)
+        field_format.choices.append("blue")
+        self.assertEqual(other_field_format.choices, ["red", "green"])
+
     def test_fails_on_empty_rule(self):
         self.assertRaises(errors.InterfaceError, fields.ChoiceFieldFormat, "color", False, None, "", _ANY_FORMAT)
         self.assertRaises(errors.InterfaceError, fields.ChoiceFieldFormat, "color", False, None, " ", _ANY_FORMAT)
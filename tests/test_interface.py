@@ -314,6 +314,15 @@ class CidTest(unittest.TestCase):
         ])
         self._test_fails_on_broken_cid_from_text(cid_text, "*cannot declare field 'some':*")
 
+    def test_fails_on_broken_row_type(self):
+        cid_text = '\n'.join([
+            ',CID with a row of an unknown type',
+            'D,Format,%s' % data.FORMAT_DELIMITED,
+            'X,some',
+        ])
+        self._test_fails_on_broken_cid_from_text(
+            cid_text, '*CID row type is "x" but must be empty or one of: *\'C\', *\'D\' or *\'F\'')
+
     def test_fails_on_broken_field_name(self):
         cid_text = '\n'.join([
             ',CID referring to a field with a type for which there is no class',
@@ -30,6 +30,7 @@ import six
 from cutplace import data
 from cutplace import interface
 from cutplace import sql
+from tests import dev_test
 
 _ANY_FORMAT = data.DataFormat(data.FORMAT_DELIMITED)
 _FIXED_FORMAT = data.DataFormat(data.FORMAT_FIXED)
@@ -293,6 +294,56 @@ class SqlFactoryTest(unittest.TestCase):
         self.assertEqual(sql_fields[4][4], False)
         self.assertEqual(sql_fields[5][1], 'varchar2')
 
+    def test_can_insert_rows_in_chunks(self):
+        cid = interface.Cid()
+        cid.read('customers', [
+            ['D', 'Format', 'delimited'],
+            ['F', 'customer_id', '12345', '', '', 'Integer', '0...99999'],
+            ['F', 'surname', 'Doe', '', '1...60', 'Text'],
+            ['F', 'select', 'x', 'X', '', 'Text'],
+            ['F', 'age', '42', 'X', '', 'Integer'],
+        ])
+        rows = [[six.text_type(customer_id), 'Doe', '', ''] for customer_id in range(5)]
+
+        sql_factory = sql.SqlFactory(cid, 'customers')
+        statement_and_row_chunks = list(sql_factory.insert_statement_and_row_chunks(rows, 2))
+        self.assertEqual(
+            [len(row_chunk) for _, row_chunk in statement_and_row_chunks], [2, 2, 1])
+        with closing(sqlite3.connect(':memory:')) as temp_database:
+            with closing(temp_database.cursor()) as temp_cursor:
+                temp_cursor.execute(sql_factory.create_table_statement())
+                for insert_statement, row_chunk in statement_and_row_chunks:
+                    temp_cursor.executemany(insert_statement, row_chunk)
+                temp_cursor.execute('select count(1) from customers')
+                self.assertEqual(temp_cursor.fetchone()[0], 5)
+                temp_cursor.execute('select count(1) from customers where age is null')
+                self.assertEqual(temp_cursor.fetchone()[0], 5)
+
+    def test_can_insert_rows_with_placeholder(self):
+        cid = interface.Cid()
+        cid.read('customers', [
+            ['D', 'Format', 'delimited'],
+            ['F', 'customer_id', '12345', '', '', 'Integer', '0...99999'],
+            ['F', 'surname', 'Doe', '', '1...60', 'Text'],
+        ])
+        sql_factory = sql.SqlFactory(cid, 'customers')
+        insert_statement, row_chunk = next(sql_factory.insert_statement_and_row_chunks([['1', 'Doe']], placeholder='%s'))
+        self.assertEqual(insert_statement, 'insert into customers (customer_id, surname) values (%s, %s)')
+        self.assertEqual(row_chunk, [('1', 'Doe')])
+
+    def test_fails_on_inserting_row_with_wrong_item_count(self):
+        cid = interface.Cid()
+        cid.read('customers', [
+            ['D', 'Format', 'delimited'],
+            ['F', 'customer_id', '12345', '', '', 'Integer', '0...99999'],
+            ['F', 'surname', 'Doe', '', '1...60', 'Text'],
+        ])
+        sql_factory = sql.SqlFactory(cid, 'customers')
+        for broken_row in (['1'], ['2', 'Doe', 'extra']):
+            dev_test.assert_raises_and_fnmatches(
+                self, AssertionError, 'row must have 2 items but has *',
+                list, sql_factory.insert_statement_and_row_chunks([broken_row]))
+
     def test_can_escape_keywords(self):
         cid = interface.Cid()
         cid.read('customers', [
@@ -22,6 +22,7 @@ from __future__ import unicode_literals
 
 import os.path
 import random
+import token
 import unittest
 
 from cutplace import _tools
@@ -57,12 +58,41 @@ class ToolsTest(unittest.TestCase):
         self.assertRaises(NameError, _tools.validated_python_name, 'x', ' ')
         self.assertRaises(NameError, _tools.validated_python_name, 'x', 'a.b')
 
+    def test_can_validate_non_ascii_python_name(self):
+        self.assertEqual(_tools.validated_python_name('x', 'a\u00e9'), 'a\u00e9')
+        self.assertEqual(_tools.validated_python_name('x', 'Gr\u00f6\u00dfe'), 'Gr\u00f6\u00dfe')
+
+    def test_fails_on_broken_python_name(self):
+        dev_test.assert_raises_and_fnmatches(
+            self, NameError, "x must not be empty but was: *''", _tools.validated_python_name, 'x', '')
+        dev_test.assert_raises_and_fnmatches(
+            self, NameError, "x must be a single word, but after *'a' there also is *'b'",
+            _tools.validated_python_name, 'x', 'a b')
+        dev_test.assert_raises_and_fnmatches(
+            self, NameError, "x must be a single word, but after *'a' there also is *'-b'",
+            _tools.validated_python_name, 'x', 'a-b')
+        dev_test.assert_raises_and_fnmatches(
+            self, NameError, "x must contain only ASCII letters, digits and underscore (_) but is: *'1337'",
+            _tools.validated_python_name, 'x', '1337')
+
     def test_can_build_human_readable_list(self):
         self.assertEqual(_tools.human_readable_list([]), '')
         self.assertEqual(_tools.human_readable_list(['a']), "'a'")
         self.assertEqual(_tools.human_readable_list(['a', 'b']), "'a' or 'b'")
         self.assertEqual(_tools.human_readable_list(['a', 'b', 'c']), "'a', 'b' or 'c'")
 
+    def test_can_tokenize_without_space(self):
+        self.assertEqual(list(_tools.tokenize_without_space('')), [(token.ENDMARKER, '')])
+        self.assertEqual(list(_tools.tokenize_without_space(' red, "green" ')), [
+            (token.NAME, 'red'), (token.OP, ','), (token.STRING, '"green"'), (token.ENDMARKER, '')])
+        self.assertEqual(list(_tools.tokenize_without_space('-1.5:0x1f')), [
+            (token.OP, '-'), (token.NUMBER, '1.5'), (token.OP, ':'), (token.NUMBER, '0x1f'), (token.ENDMARKER, '')])
+        self.assertEqual(list(_tools.tokenize_without_space('<= x, ...')), [
+            (token.OP, '<='), (token.NAME, 'x'), (token.OP, ','), (token.OP, '...'), (token.ENDMARKER, '')])
+        first_token = next(_tools.tokenize_without_space('red'))
+        self.assertEqual(first_token.type, token.NAME)
+        self.assertEqual(first_token.text, 'red')
+
     def _test_can_derive_suffix(self, expected_path, path_to_test, suffix_to_test):
         actualPath = _tools.with_suffix(path_to_test, suffix_to_test)
         self.assertEqual(expected_path, actualPath)